@@ -2,6 +2,7 @@
 
 import os
 import re
+from functools import lru_cache
 from typing import Optional
 from urllib.parse import urlparse
 
@@ -19,6 +20,12 @@ def is_safe_repo_relative(path: str) -> bool:
     return True
 
 
+@lru_cache(maxsize=64)
+def _realpath(path: str) -> str:
+    return os.path.realpath(path)
+
+
+@lru_cache(maxsize=4096)
 def normalize_reference(ref: str) -> str:
     ref = ref.strip()
 
@@ -40,6 +47,9 @@ def normalize_reference(ref: str) -> str:
     return ref
 
 
+# Absolute references are resolved with os.path.realpath, so cached results
+# reflect the filesystem as of the first lookup within the process.
+@lru_cache(maxsize=2048)
 def resolve_ref_to_repo_path(repo_root: str, ref: str) -> str:
     ref = normalize_reference(ref)
     if not ref:
@@ -83,7 +93,7 @@ def resolve_ref_to_repo_path(repo_root: str, ref: str) -> str:
 
     if os.path.isabs(ref):
         abs_path = os.path.realpath(ref)
-        repo_abs = os.path.realpath(repo_root)
+        repo_abs = _realpath(repo_root)
         if not abs_path.startswith(repo_abs + os.sep):
             raise ValueError(f"absolute path outside repo: {ref}")
         rel = os.path.relpath(abs_path, repo_abs)
@@ -14,8 +14,10 @@ Defaults to current working directory as repo root.
 
 from __future__ import annotations
 
+import os
 import re
 import sys
+from collections import Counter, namedtuple
 from pathlib import Path, PurePosixPath
 
 # Required sections in every decision body (from _template.md / README.md)
@@ -36,9 +38,14 @@ SKIP_FILES: set[str] = {"_template.md", "README.md"}
 # Pattern matching Decision-ID values (D-YYYY-MM-DD-UPPER_SNAKE)
 DECISION_ID_RE = re.compile(r"D-\d{4}-\d{2}-\d{2}-[A-Z][A-Z0-9_]*")
 
-INDEX_ENTRY_RE = re.compile(
-    r"^-\s+(D-\d{4}-\d{2}-\d{2}-[A-Z][A-Z0-9_]*):\s+\[`([^`]+)`\]\(([^)]+)\)\s*$"
-)
+# Markdown structure patterns, compiled once and reused by the per-line scanners
+FENCE_RE = re.compile(r"^\s*([`~]{3,})")
+H2_RE = re.compile(r"^##\s+(.+)")
+H2_BOUNDARY_RE = re.compile(r"^##(?!#)\s+")
+H3_PLUS_RE = re.compile(r"^#{3,}\s+")
+DECISION_ID_HEADER_RE = re.compile(r"^##\s+Decision-ID")
+SUPERSEDES_HEADER_RE = re.compile(r"^##\s+Supersedes")
+INDEX_HEADER_RE = re.compile(r"^##\s+Decision Index")
 
 
 def eprint(*args: object) -> None:
@@ -52,7 +59,7 @@ def iter_non_fenced_lines(text: str) -> list[str]:
     fence_len = 0
 
     for line in text.splitlines():
-        fence_match = re.match(r"^\s*([`~]{3,})", line)
+        fence_match = FENCE_RE.match(line)
         if fence_match:
             marker = fence_match.group(1)
             marker_char = marker[0]
@@ -76,66 +83,99 @@ def iter_non_fenced_lines(text: str) -> list[str]:
     return lines
 
 
-def find_sections(text: str) -> set[str]:
-    """Extract H2 section names from markdown text."""
-    sections: set[str] = set()
-    for line in iter_non_fenced_lines(text):
-        m = re.match(r"^##\s+(.+)", line)
-        if m:
-            sections.add(m.group(1).strip())
-    return sections
-
-
-def extract_decision_id(text: str) -> str | None:
-    """Extract the Decision-ID value from body text."""
-    in_id_section = False
-    for line in iter_non_fenced_lines(text):
-        if re.match(r"^##\s+Decision-ID", line):
-            in_id_section = True
-            continue
-        if in_id_section:
-            stripped = line.strip()
-            if not stripped:
-                continue
-            if stripped.startswith("#"):
-                break
-            if DECISION_ID_RE.fullmatch(stripped):
-                return stripped
-    return None
+DecisionBody = namedtuple(
+    "DecisionBody", ["sections", "decision_id", "supersedes", "invalid_supersedes"]
+)
 
 
-def extract_supersedes(text: str) -> tuple[list[str], list[str]]:
-    """Extract Supersedes Decision-ID references and invalid entries from body text."""
-    in_supersedes = False
+def parse_body(text: str) -> DecisionBody:
+    """Scan a decision body once for H2 sections, Decision-ID and Supersedes."""
+    sections: set[str] = set()
+    decision_id: str | None = None
     refs: list[str] = []
     invalid_entries: list[str] = []
+    in_id_section = False
+    id_done = False
+    in_supersedes = False
+    supersedes_done = False
+
     for line in iter_non_fenced_lines(text):
-        if re.match(r"^##\s+Supersedes", line):
+        # Every header regex below is anchored on "##"; most lines are body text.
+        is_h2 = line.startswith("##")
+        if is_h2:
+            m = H2_RE.match(line)
+            if m:
+                sections.add(m.group(1).strip())
+
+        if not id_done:
+            if is_h2 and DECISION_ID_HEADER_RE.match(line):
+                in_id_section = True
+            elif in_id_section:
+                stripped = line.strip()
+                if stripped.startswith("#"):
+                    id_done = True
+                elif DECISION_ID_RE.fullmatch(stripped):
+                    decision_id = stripped
+                    id_done = True
+
+        if supersedes_done:
+            continue
+        if is_h2 and SUPERSEDES_HEADER_RE.match(line):
             in_supersedes = True
             continue
-        if in_supersedes:
-            stripped = line.strip()
-            if stripped.startswith("#"):
-                break
-            if not stripped:
-                continue
-            # Skip N/A
-            if stripped in ("- N/A", "N/A"):
-                continue
-            payload = stripped
-            if payload.startswith("-"):
-                payload = payload[1:].strip()
+        if not in_supersedes:
+            continue
+        stripped = line.strip()
+        if stripped.startswith("#"):
+            supersedes_done = True
+            continue
+        if not stripped:
+            continue
+        # Skip N/A
+        if stripped in ("- N/A", "N/A"):
+            continue
+        payload = stripped
+        if payload.startswith("-"):
+            payload = payload[1:].strip()
 
-            tokens = [token.strip() for token in payload.split(",") if token.strip()]
-            if not tokens:
-                invalid_entries.append(stripped)
-                continue
+        tokens = [token.strip() for token in payload.split(",") if token.strip()]
+        if not tokens:
+            invalid_entries.append(stripped)
+            continue
 
-            if all(DECISION_ID_RE.fullmatch(token) for token in tokens):
-                refs.extend(tokens)
-            else:
-                invalid_entries.append(stripped)
-    return refs, invalid_entries
+        if all(DECISION_ID_RE.fullmatch(token) for token in tokens):
+            refs.extend(tokens)
+        else:
+            invalid_entries.append(stripped)
+
+    return DecisionBody(
+        sections=sections,
+        decision_id=decision_id,
+        supersedes=refs,
+        invalid_supersedes=invalid_entries,
+    )
+
+
+def parse_index_entry(line: str) -> tuple[str, str] | None:
+    """Parse a stripped index line of the form ``- <Decision-ID>: [`<path>`](<link>)``.
+
+    Returns (decision_id, link) or None when the line does not match the format.
+    """
+    if not line.startswith("-") or not line[1:2].isspace():
+        return None
+    did, sep, rest = line[1:].lstrip().partition(":")
+    if not sep or not rest[:1].isspace() or not DECISION_ID_RE.fullmatch(did):
+        return None
+    rest = rest.lstrip()
+    if not rest.startswith("[`"):
+        return None
+    path, sep, rest = rest[2:].partition("`")
+    if not sep or not path or not rest.startswith("]("):
+        return None
+    link, sep, tail = rest[2:].partition(")")
+    if not sep or not link or tail.strip():
+        return None
+    return did, link
 
 
 def parse_index(index_path: Path) -> tuple[list[tuple[str, str]], list[str]]:
@@ -156,15 +196,17 @@ def parse_index(index_path: Path) -> tuple[list[tuple[str, str]], list[str]]:
     found_index_header = False
     in_html_comment = False
     for lineno, line in enumerate(text.splitlines(), start=1):
-        if re.match(r"^##\s+Decision Index", line):
+        is_header = line.startswith("##")
+        if is_header and INDEX_HEADER_RE.match(line):
             in_index = True
             found_index_header = True
             continue
         if in_index:
-            if re.match(r"^##(?!#)\s+", line):
-                break
-            if re.match(r"^#{3,}\s+", line):
-                continue
+            if is_header:
+                if H2_BOUNDARY_RE.match(line):
+                    break
+                if H3_PLUS_RE.match(line):
+                    continue
             stripped = line.strip()
             if in_html_comment:
                 if "-->" in stripped:
@@ -179,9 +221,9 @@ def parse_index(index_path: Path) -> tuple[list[tuple[str, str]], list[str]]:
             if not stripped:
                 continue
 
-            m = INDEX_ENTRY_RE.match(stripped)
-            if m:
-                entries.append((m.group(1), m.group(3)))
+            entry = parse_index_entry(stripped)
+            if entry:
+                entries.append(entry)
             else:
                 errors.append(
                     f"Invalid Decision Index line at {index_path}:{lineno}: {stripped}"
@@ -207,13 +249,24 @@ def validate(repo_root: Path) -> list[str]:
         return errors
 
     # --- Collect body files ---
-    body_files: dict[str, Path] = {}
     body_repo_paths: dict[str, Path] = {}
+    body_texts: dict[str, str] = {}
     if decisions_dir.exists():
-        for f in sorted(decisions_dir.iterdir()):
-            if f.is_file() and f.name not in SKIP_FILES and f.suffix == ".md":
-                body_files[f.name] = f
-                body_repo_paths[f"docs/decisions/{f.name}"] = f
+        with os.scandir(decisions_dir) as it:
+            entries = sorted(
+                (
+                    e
+                    for e in it
+                    if os.path.splitext(e.name)[1] == ".md"
+                    and e.name not in SKIP_FILES
+                    and e.is_file()
+                ),
+                key=lambda e: e.name,
+            )
+        for e in entries:
+            f = Path(e.path)
+            body_repo_paths[f"docs/decisions/{e.name}"] = f
+            body_texts[e.name] = f.read_text(encoding="utf-8")
 
     template_path = decisions_dir / "_template.md"
     if not template_path.exists():
@@ -222,19 +275,24 @@ def validate(repo_root: Path) -> list[str]:
             "(required for AC1 validation)"
         )
     else:
-        template_sections = find_sections(template_path.read_text(encoding="utf-8"))
+        template_sections = parse_body(
+            template_path.read_text(encoding="utf-8")
+        ).sections
         for req in REQUIRED_SECTIONS:
             if req not in template_sections:
                 errors.append(
                     f"docs/decisions/_template.md: missing required section '## {req}'"
                 )
 
+    bodies: dict[str, DecisionBody] = {
+        fname: parse_body(text) for fname, text in body_texts.items()
+    }
+
     # --- Collect all known Decision-IDs (from body files) ---
     body_decision_ids: dict[str, str] = {}
     all_decision_ids: dict[str, str] = {}
-    for fname, fpath in body_files.items():
-        text = fpath.read_text(encoding="utf-8")
-        did = extract_decision_id(text)
+    for fname, body in bodies.items():
+        did = body.decision_id
         if not did:
             errors.append(
                 f"docs/decisions/{fname}: missing or invalid Decision-ID value "
@@ -254,9 +312,7 @@ def validate(repo_root: Path) -> list[str]:
         all_decision_ids[did] = fname
 
     # --- AC2: Check for duplicates in index ---
-    seen_ids: dict[str, int] = {}
-    for did, _ in index_entries:
-        seen_ids[did] = seen_ids.get(did, 0) + 1
+    seen_ids = Counter(did for did, _ in index_entries)
     for did, count in seen_ids.items():
         if count > 1:
             errors.append(
@@ -322,27 +378,23 @@ def validate(repo_root: Path) -> list[str]:
                 f"— add it to docs/decisions.md ## Decision Index"
             )
 
-    for fname, fpath in body_files.items():
-        text = fpath.read_text(encoding="utf-8")
-        sections = find_sections(text)
+    for fname, body in bodies.items():
         for req in REQUIRED_SECTIONS:
-            if req not in sections:
+            if req not in body.sections:
                 errors.append(
                     f"docs/decisions/{fname}: missing required section '## {req}' "
                     f"(Rationale etc. — see _template.md)"
                 )
 
     # --- AC3: Check Supersedes references ---
-    for fname, fpath in body_files.items():
-        text = fpath.read_text(encoding="utf-8")
-        supersedes_refs, invalid_supersedes_entries = extract_supersedes(text)
-        for invalid_entry in invalid_supersedes_entries:
+    for fname, body in bodies.items():
+        for invalid_entry in body.invalid_supersedes:
             errors.append(
                 f"docs/decisions/{fname}: invalid Supersedes entry '{invalid_entry}'. "
                 f"修正指針: D-YYYY-MM-DD-UPPER_SNAKE 形式のDecision-IDを指定してください。"
             )
 
-        for ref_id in supersedes_refs:
+        for ref_id in body.supersedes:
             if ref_id not in all_decision_ids:
                 errors.append(
                     f"docs/decisions/{fname}: Supersedes references non-existent "
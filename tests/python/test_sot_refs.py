@@ -0,0 +1,96 @@
+from __future__ import annotations
+
+import importlib.util
+from pathlib import Path
+from types import ModuleType
+
+import pytest
+
+
+def _load_script_module(module_name: str, script_name: str) -> ModuleType:
+    repo_root = Path(__file__).resolve().parents[2]
+    module_path = repo_root / "scripts" / script_name
+    spec = importlib.util.spec_from_file_location(module_name, module_path)
+    if spec is None or spec.loader is None:
+        raise RuntimeError(f"Failed to load module spec: {module_path}")
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+MODULE = _load_script_module("sot_refs", "sot_refs.py")
+
+REPO_ROOT = "/nonexistent-repo"
+
+
+@pytest.mark.parametrize(
+    ("ref", "expected"),
+    [
+        ("https://github.com/o/r/blob/main/docs/prd/a.md", "docs/prd/a.md"),
+        ("https://github.com/o/r/tree/main/docs/epics", "docs/epics"),
+        pytest.param(
+            "https://raw.githubusercontent.com/o/r/main/docs/prd/a.md",
+            "docs/prd/a.md",
+            marks=pytest.mark.xfail(
+                strict=True,
+                reason="raw URL branch slices parts[4:] and drops the first path segment",
+            ),
+        ),
+        # userinfo and port are not part of the host
+        ("https://user:pw@github.com:443/o/r/blob/main/docs/a.md", "docs/a.md"),
+        ("http://github.com:8080/o/r/blob/main/docs/a.md", "docs/a.md"),
+        # query, fragment and ;params are dropped
+        ("https://github.com/o/r/blob/main/docs/a.md?plain=1", "docs/a.md"),
+        ("https://github.com/o/r/blob/main/docs/a.md#L10", "docs/a.md"),
+        ("https://github.com/o/r/blob/main/docs/a.md;p", "docs/a.md"),
+        # tab/CR/LF inside the URL are removed
+        ("https://github.com/o/r/blob/main/do\tcs/a.md", "docs/a.md"),
+        ("[PRD](https://github.com/o/r/blob/main/docs/prd/a.md)", "docs/prd/a.md"),
+    ],
+)
+def test_resolve_ref_to_repo_path_github_urls(ref: str, expected: str) -> None:
+    assert MODULE.resolve_ref_to_repo_path(REPO_ROOT, ref) == expected
+
+
+@pytest.mark.parametrize(
+    "ref",
+    [
+        "https://RAW.githubusercontent.com/o/r/main/docs/a.md",
+        "https://user:pw@raw.githubusercontent.com:443/o/r/main/docs/a.md",
+        "https://raw.githubusercontent.com/o/r/main/docs/a.md?token=x",
+        "https://raw.githubusercontent.com/o/r/main/docs/a.md;p",
+    ],
+)
+def test_resolve_ref_to_repo_path_raw_url_host_variants(ref: str) -> None:
+    plain = "https://raw.githubusercontent.com/o/r/main/docs/a.md"
+    assert MODULE.resolve_ref_to_repo_path(REPO_ROOT, ref) == (
+        MODULE.resolve_ref_to_repo_path(REPO_ROOT, plain)
+    )
+
+
+@pytest.mark.parametrize(
+    "ref",
+    [
+        "https://github.com/o/r/blob/main",
+        "https://github.com/o/r/tree/main",
+        "https://raw.githubusercontent.com/o/r/main",
+        "https://github.com/o/r/blob/main/../secret",
+        "https://example.com/o/r/main/docs/a.md",
+        "https://[::1/o/r/blob/main/docs/a.md",
+        "https://[1.2.3.4]/o/r/blob/main/docs/a.md",
+    ],
+)
+def test_resolve_ref_to_repo_path_rejects_invalid_urls(ref: str) -> None:
+    with pytest.raises(ValueError):
+        MODULE.resolve_ref_to_repo_path(REPO_ROOT, ref)
+
+
+def test_resolve_ref_to_repo_path_relative_refs() -> None:
+    assert MODULE.resolve_ref_to_repo_path(REPO_ROOT, "./docs/prd/a.md") == (
+        "docs/prd/a.md"
+    )
+    assert MODULE.resolve_ref_to_repo_path(REPO_ROOT, "`docs/epics/b.md`") == (
+        "docs/epics/b.md"
+    )
+    with pytest.raises(ValueError):
+        MODULE.resolve_ref_to_repo_path(REPO_ROOT, "../outside.md")